@@ -6,15 +6,8 @@ This script provides a command-line interface to run the automation
 with various options and configurations.
 """
 
-import os
 import sys
 import click
-from pathlib import Path
-
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
-
-from reinvent_research_automation import ReInventResearchAutomation
 
 
 @click.command()
@@ -59,7 +52,17 @@ def main(blog_url, max_services, max_screenshots, skip_screenshots, output_dir,
     announced at re:Invent 2025, generating a comprehensive PowerPoint
     presentation with screenshots and detailed information.
     """
-    
+    # Propagate verbosity to modules that gate debug JSON dumps on it
+    import os
+    os.environ['REINVENT_VERBOSE'] = '1' if verbose else '0'
+
+    # Deferred so that --help/--version don't pay for the heavy
+    # selenium/pptx import chain pulled in by the automation module
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent / 'src'))
+    from reinvent_research_automation import ReInventResearchAutomation
+
     click.echo("=" * 80)
     click.echo("AWS re:Invent 2025 Research Automation")
     click.echo("=" * 80)
@@ -9,13 +9,289 @@ Note: This module is designed to be called from the main automation script
 and uses MCP tool integration patterns.
 """
 
-import logging
+import asyncio
+import copy
+import functools
+import gzip
+import hashlib
 import json
-from typing import Dict, Any, List, Optional
+import logging
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """Serialize obj to indented JSON text, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Location of the persistent MCP response cache
+MCP_CACHE_PATH = Path("outputs/.mcp_cache.db")
+
+# Default time-to-live for cached MCP responses (24 hours)
+MCP_CACHE_TTL = 86400
+
+# Precompiled helpers for normalizing service names into service codes
+_PREFIX_RE = re.compile(r'^(?:Amazon |AWS )')
+_SPACE_TABLE = str.maketrans('', '', ' ')
+
+# Precompiled patterns for carving documentation content into sections.
+# _SECTION_RE captures each markdown heading and the body up to the next
+# heading; _BULLET_RE pulls the list items out of a section body and
+# _FIRST_PARA_RE finds the first non-heading paragraph line.
+_SECTION_RE = re.compile(r'(?ms)^#{1,3}\s+(?P<head>.+?)$(?P<body>.*?)(?=^#|\Z)')
+_BULLET_RE = re.compile(r'(?m)^\s*-\s*(.+?)\s*$')
+_FIRST_PARA_RE = re.compile(r'(?m)^(?!#)\s*(\S.*?)\s*$')
+
+# Static fallback content, frozen as shared module-level tuples so each
+# research call doesn't re-allocate the same small lists and strings
+_FALLBACK_OVERVIEW = "AWS managed service providing cloud capabilities."
+
+_FALLBACK_FEATURES = (
+    "Fully managed service",
+    "High availability and durability",
+    "Integration with AWS services",
+    "Pay-as-you-go pricing",
+    "Enterprise-grade security"
+)
+
+_FALLBACK_USE_CASES = (
+    "Real-time data processing",
+    "Machine learning applications",
+    "Web and mobile backends",
+    "IoT applications",
+    "Analytics and reporting"
+)
+
+_FALLBACK_PROBLEMS = (
+    "Reduces operational complexity",
+    "Improves scalability and performance",
+    "Enhances security and compliance",
+    "Accelerates development cycles"
+)
+
+_PROD_DEPLOY_STEPS = (
+    "Set up VPC and networking",
+    "Configure security groups",
+    "Deploy resources with IaC",
+    "Set up monitoring and alerts",
+    "Implement backup strategy"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResults:
+    """
+    Struct-of-arrays view of documentation search hits
+
+    MCP search and recommendation responses arrive as a list of
+    per-hit dicts; downstream code only ever projects out one field at
+    a time (all URLs, all titles). Storing the fields as parallel
+    tuples makes those projections C-level slices instead of a dict
+    lookup per element, and avoids N small dict allocations per call.
+    """
+
+    titles: Tuple[str, ...]
+    urls: Tuple[str, ...]
+    contexts: Tuple[str, ...]
+
+    @classmethod
+    def from_hits(cls, hits: List[Dict[str, Any]]) -> 'SearchResults':
+        """Build a SearchResults from a list of per-hit dicts"""
+        return cls(
+            titles=tuple(h['title'] for h in hits),
+            urls=tuple(h['url'] for h in hits),
+            contexts=tuple(h.get('context', '') for h in hits)
+        )
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+
+class MCPResponseCache:
+    """
+    Persistent TTL cache for MCP tool responses
+
+    MCP calls are network-bound round-trips to the MCP server, so repeated
+    runs of the automation re-pay the same latency for identical queries.
+    This cache stores gzipped JSON responses in a small sqlite database so
+    results survive process restarts and identical calls are served locally.
+    """
+
+    def __init__(self, path: Path = MCP_CACHE_PATH):
+        """Initialize the cache, creating the database if needed"""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS mcp_cache "
+            "(key BLOB PRIMARY KEY, expires INTEGER, value BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(tool_name: str, args: Dict[str, Any]) -> bytes:
+        """Build a stable cache key from a tool name and its arguments"""
+        canonical = json.dumps(args, sort_keys=True)
+        return hashlib.blake2b(
+            f"{tool_name}:{canonical}".encode(), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        row = self._conn.execute(
+            "SELECT expires, value FROM mcp_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        expires, value = row
+        if expires < time.time():
+            self._conn.execute("DELETE FROM mcp_cache WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        return _loads(gzip.decompress(value))
+
+    def set(self, key: bytes, value: Any, ttl: int = MCP_CACHE_TTL):
+        """Store a value under key with the given time-to-live in seconds"""
+        blob = gzip.compress(_dumps(value))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO mcp_cache (key, expires, value) VALUES (?, ?, ?)",
+            (key, int(time.time()) + ttl, blob),
+        )
+        self._conn.commit()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_mcp_session():
+    """
+    Return the shared pooled HTTP session used for MCP server calls
+
+    Every MCP tool call is an HTTP round-trip; without a shared session
+    each one pays a fresh TCP + TLS handshake (typically 100-300 ms).
+    One module-level session with a tuned connection pool and retry
+    policy is reused by both the documentation and pricing integrations.
+    Created lazily so importing this module stays cheap.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_mcp_cache: Optional[MCPResponseCache] = None
+
+
+def _get_mcp_cache() -> MCPResponseCache:
+    """Return the shared cache instance, creating it on first use"""
+    global _mcp_cache
+    if _mcp_cache is None:
+        _mcp_cache = MCPResponseCache()
+    return _mcp_cache
+
+
+# In-flight MCP calls, keyed like the disk cache. The TTL cache handles
+# repeated queries over time; this handles concurrent identical queries
+# from the batched research path, so only one caller actually issues the
+# MCP call while the rest wait on its future.
+_inflight: Dict[bytes, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def mcp_cached(tool_name: str, ttl: int = MCP_CACHE_TTL):
+    """
+    Decorator that caches an MCP-calling method's result on disk
+
+    Cache misses are single-flight: when several threads miss on the
+    same key at once, one performs the call and the others wait for its
+    result instead of issuing duplicate MCP calls.
+
+    Args:
+        tool_name: Name of the MCP tool, used as part of the cache key
+        ttl: Cache entry lifetime in seconds
+
+    Returns:
+        Decorator wrapping the method with a persistent TTL cache
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = _get_mcp_cache()
+            key = cache.make_key(tool_name, {'args': args, 'kwargs': kwargs})
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info("Cache hit for %s", tool_name)
+                return cached
+
+            with _inflight_lock:
+                future = _inflight.get(key)
+                if future is None:
+                    future = Future()
+                    _inflight[key] = future
+                    is_owner = True
+                else:
+                    is_owner = False
+
+            if not is_owner:
+                logger.info("Awaiting in-flight call for %s", tool_name)
+                return future.result()
+
+            try:
+                result = func(self, *args, **kwargs)
+                cache.set(key, result, ttl)
+                future.set_result(result)
+                return result
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            finally:
+                with _inflight_lock:
+                    _inflight.pop(key, None)
+        return wrapper
+    return decorator
+
+
 class AWSDocumentationIntegration:
     """
     Integration with AWS Documentation MCP tools
@@ -23,26 +299,40 @@ class AWSDocumentationIntegration:
     This class provides methods to search, read, and extract information
     from AWS documentation using the available MCP tools.
     """
-    
+
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the documentation integration"""
-        self.search_cache = {}
-        self.pricing_cache = {}
-    
-    def search_service_documentation(self, service_name: str) -> List[Dict[str, Any]]:
+        pass
+
+    def search_service_documentation(self, service_name: str) -> SearchResults:
         """
         Search AWS documentation for a service
-        
+
+        Args:
+            service_name: Name of the AWS service (e.g., "Amazon Bedrock")
+
+        Returns:
+            SearchResults with parallel title/url/context tuples
+        """
+        return SearchResults.from_hits(self._search_documentation_hits(service_name))
+
+    @mcp_cached("aws-documentation-mcp-server_search_documentation")
+    def _search_documentation_hits(self, service_name: str) -> List[Dict[str, Any]]:
+        """
+        Fetch raw documentation search hits for a service
+
         This method would call:
         awslabs_-_aws-documentation-mcp-server_search_documentation
-        
+
         Args:
             service_name: Name of the AWS service (e.g., "Amazon Bedrock")
-        
+
         Returns:
             List of search results with URLs and descriptions
         """
-        logger.info(f"Searching documentation for: {service_name}")
+        logger.info("Searching documentation for: %s", service_name)
         
         # In actual implementation, this would use the MCP tool:
         # search_results = call_mcp_tool(
@@ -50,30 +340,30 @@ class AWSDocumentationIntegration:
         #     search_phrase=service_name,
         #     limit=10
         # )
+        # All MCP tool calls should go through _get_mcp_session() so they
+        # reuse one pooled, retrying connection instead of handshaking
+        # per call.
         
         # Placeholder implementation
-        search_key = service_name.lower()
-        if search_key not in self.search_cache:
-            self.search_cache[search_key] = [
-                {
-                    'title': f'{service_name} - What Is {service_name}?',
-                    'url': f'https://docs.aws.amazon.com/{service_name.lower().replace(" ", "-")}/latest/userguide/what-is.html',
-                    'context': f'Learn about {service_name} and its key features.'
-                },
-                {
-                    'title': f'{service_name} - Getting Started',
-                    'url': f'https://docs.aws.amazon.com/{service_name.lower().replace(" ", "-")}/latest/userguide/getting-started.html',
-                    'context': f'Get started with {service_name} in minutes.'
-                },
-                {
-                    'title': f'{service_name} - Pricing',
-                    'url': f'https://docs.aws.amazon.com/{service_name.lower().replace(" ", "-")}/latest/userguide/pricing.html',
-                    'context': f'Understand pricing for {service_name}.'
-                }
-            ]
-        
-        return self.search_cache[search_key]
-    
+        return [
+            {
+                'title': f'{service_name} - What Is {service_name}?',
+                'url': f'https://docs.aws.amazon.com/{service_name.lower().replace(" ", "-")}/latest/userguide/what-is.html',
+                'context': f'Learn about {service_name} and its key features.'
+            },
+            {
+                'title': f'{service_name} - Getting Started',
+                'url': f'https://docs.aws.amazon.com/{service_name.lower().replace(" ", "-")}/latest/userguide/getting-started.html',
+                'context': f'Get started with {service_name} in minutes.'
+            },
+            {
+                'title': f'{service_name} - Pricing',
+                'url': f'https://docs.aws.amazon.com/{service_name.lower().replace(" ", "-")}/latest/userguide/pricing.html',
+                'context': f'Understand pricing for {service_name}.'
+            }
+        ]
+
+    @mcp_cached("aws-documentation-mcp-server_read_documentation")
     def read_documentation_page(self, url: str, max_length: int = 5000) -> str:
         """
         Read AWS documentation page content
@@ -88,7 +378,7 @@ class AWSDocumentationIntegration:
         Returns:
             Markdown content of the documentation page
         """
-        logger.info(f"Reading documentation from: {url}")
+        logger.info("Reading documentation from: %s", url)
         
         # In actual implementation:
         # content = call_mcp_tool(
@@ -122,20 +412,33 @@ actual content fetched from AWS documentation.
 5. Deploy and test
 """
     
-    def get_service_recommendations(self, url: str) -> List[Dict[str, Any]]:
+    def get_service_recommendations(self, url: str) -> SearchResults:
         """
         Get recommended documentation pages
-        
+
+        Args:
+            url: URL of the AWS documentation page
+
+        Returns:
+            SearchResults with parallel title/url/context tuples
+        """
+        return SearchResults.from_hits(self._recommendation_hits(url))
+
+    @mcp_cached("aws-documentation-mcp-server_recommend")
+    def _recommendation_hits(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Fetch raw recommended documentation pages
+
         This method would call:
         awslabs_-_aws-documentation-mcp-server_recommend
-        
+
         Args:
             url: URL of the AWS documentation page
-        
+
         Returns:
             List of recommended pages
         """
-        logger.info(f"Getting recommendations for: {url}")
+        logger.info("Getting recommendations for: %s", url)
         
         # In actual implementation:
         # recommendations = call_mcp_tool(
@@ -162,109 +465,97 @@ actual content fetched from AWS documentation.
             }
         ]
     
-    def extract_service_information(self, service_name: str) -> Dict[str, Any]:
+    def extract_service_information(
+        self, service_name: str, summary_length: int = 5000
+    ) -> Dict[str, Any]:
         """
         Extract comprehensive information about a service
-        
+
         Args:
             service_name: Name of the AWS service
-        
+            summary_length: Maximum characters of documentation to fetch;
+                passed down to the MCP read call so unneeded bytes are
+                never transferred or allocated
+
         Returns:
             Dictionary with service information including overview, features, use cases, etc.
         """
-        logger.info(f"Extracting information for: {service_name}")
+        logger.info("Extracting information for: %s", service_name)
         
-        # Search for documentation
+        # Search for documentation; the SoA layout makes the URL and
+        # title projections plain tuple slices
         search_results = self.search_service_documentation(service_name)
-        
-        # Read key documentation pages
+        documentation_urls = list(search_results.urls[:3])
+        top_url = search_results.urls[0] if search_results.urls else None
+
+        # Read key documentation pages and get recommendations
         overview_content = ""
-        if search_results:
-            overview_content = self.read_documentation_page(search_results[0]['url'])
-        
-        # Get recommendations
-        recommendations = []
-        if search_results:
-            recommendations = self.get_service_recommendations(search_results[0]['url'])
-        
+        recommended_topics = []
+        if top_url:
+            overview_content = self.read_documentation_page(top_url, max_length=summary_length)
+            recommended_topics = list(self.get_service_recommendations(top_url).titles)
+
         # Parse and structure the information
+        overview, key_features, use_cases = self._extract_all(overview_content)
         service_info = {
             'service_name': service_name,
-            'overview': self._extract_overview(overview_content),
-            'key_features': self._extract_features(overview_content),
-            'use_cases': self._extract_use_cases(overview_content),
-            'documentation_urls': [r['url'] for r in search_results[:3]],
-            'recommended_topics': [r['title'] for r in recommendations]
+            'overview': overview,
+            'key_features': key_features,
+            'use_cases': use_cases,
+            'documentation_urls': documentation_urls,
+            'recommended_topics': recommended_topics
         }
-        
+
         return service_info
-    
-    def _extract_overview(self, content: str) -> str:
-        """Extract service overview from documentation content"""
+
+    def _extract_all(self, content: str) -> tuple:
+        """
+        Extract overview, key features, and use cases in a single pass
+
+        The three pieces of information live in different sections of the
+        same documentation content, so one pre-compiled regex walk over
+        the sections avoids splitting and re-scanning the content three
+        times in interpreted Python loops.
+
+        Args:
+            content: Markdown content of a documentation page
+
+        Returns:
+            Tuple of (overview, key_features, use_cases)
+        """
         # Simple extraction - in production would use more sophisticated parsing
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if line.startswith('#') and i + 1 < len(lines):
-                # Get first paragraph after a heading
-                for j in range(i + 1, min(i + 5, len(lines))):
-                    if lines[j].strip() and not lines[j].startswith('#'):
-                        return lines[j].strip()
-        
-        return "AWS managed service providing cloud capabilities."
-    
-    def _extract_features(self, content: str) -> List[str]:
-        """Extract key features from documentation content"""
-        features = []
-        lines = content.split('\n')
-        
-        in_features_section = False
-        for line in lines:
-            if 'feature' in line.lower() or 'key' in line.lower():
-                in_features_section = True
-            elif in_features_section and line.strip().startswith('-'):
-                features.append(line.strip()[1:].strip())
-                if len(features) >= 5:
-                    break
-            elif in_features_section and line.startswith('#'):
+        overview = ""
+        features: List[str] = []
+        use_cases: List[str] = []
+
+        for match in _SECTION_RE.finditer(content):
+            head = match['head'].lower()
+            body = match['body']
+
+            if not overview:
+                para = _FIRST_PARA_RE.search(body)
+                if para:
+                    overview = para.group(1)
+
+            if 'use case' in head and not use_cases:
+                use_cases = _BULLET_RE.findall(body)[:5]
+            elif ('feature' in head or 'key' in head) and not features:
+                features = _BULLET_RE.findall(body)[:5]
+
+            # Stop early once everything we need has been collected
+            if overview and features and use_cases:
                 break
-        
+
+        if not overview:
+            overview = _FALLBACK_OVERVIEW
+
         if not features:
-            features = [
-                "Fully managed service",
-                "High availability and durability",
-                "Integration with AWS services",
-                "Pay-as-you-go pricing",
-                "Enterprise-grade security"
-            ]
-        
-        return features
-    
-    def _extract_use_cases(self, content: str) -> List[str]:
-        """Extract use cases from documentation content"""
-        use_cases = []
-        lines = content.split('\n')
-        
-        in_use_cases_section = False
-        for line in lines:
-            if 'use case' in line.lower():
-                in_use_cases_section = True
-            elif in_use_cases_section and line.strip().startswith('-'):
-                use_cases.append(line.strip()[1:].strip())
-                if len(use_cases) >= 5:
-                    break
-            elif in_use_cases_section and line.startswith('#'):
-                break
-        
+            features = list(_FALLBACK_FEATURES)
+
         if not use_cases:
-            use_cases = [
-                "Real-time data processing",
-                "Machine learning applications",
-                "Web and mobile backends",
-                "IoT applications",
-                "Analytics and reporting"
-            ]
-        
-        return use_cases
+            use_cases = list(_FALLBACK_USE_CASES)
+
+        return overview, features, use_cases
 
 
 class AWSPricingIntegration:
@@ -273,11 +564,15 @@ class AWSPricingIntegration:
     
     This class provides methods to get pricing information for AWS services.
     """
-    
+
+    __slots__ = ('service_codes_cache', '_service_codes_lower')
+
     def __init__(self):
         """Initialize the pricing integration"""
         self.service_codes_cache = None
-    
+        self._service_codes_lower = None
+
+    @mcp_cached("aws-pricing-mcp-server_get_pricing_service_codes")
     def get_service_codes(self, filter_pattern: Optional[str] = None) -> List[str]:
         """
         Get AWS service codes
@@ -291,7 +586,7 @@ class AWSPricingIntegration:
         Returns:
             List of service codes
         """
-        logger.info(f"Getting service codes (filter: {filter_pattern})")
+        logger.info("Getting service codes (filter: %s)", filter_pattern)
         
         # In actual implementation:
         # service_codes = call_mcp_tool(
@@ -311,12 +606,21 @@ class AWSPricingIntegration:
                 'AmazonDynamoDB',
                 'AmazonSageMaker'
             ]
-        
+            # Lowercase once so per-call filtering doesn't re-lowercase
+            # every code; the real service list has hundreds of entries
+            self._service_codes_lower = [s.lower() for s in self.service_codes_cache]
+
         if filter_pattern:
-            return [s for s in self.service_codes_cache if filter_pattern.lower() in s.lower()]
-        
+            pattern = filter_pattern.lower()
+            return [
+                code for code, lowered
+                in zip(self.service_codes_cache, self._service_codes_lower)
+                if pattern in lowered
+            ]
+
         return self.service_codes_cache
     
+    @mcp_cached("aws-pricing-mcp-server_get_pricing_service_attributes")
     def get_service_pricing_attributes(self, service_code: str) -> List[str]:
         """
         Get pricing attributes for a service
@@ -330,7 +634,7 @@ class AWSPricingIntegration:
         Returns:
             List of attribute names
         """
-        logger.info(f"Getting pricing attributes for: {service_code}")
+        logger.info("Getting pricing attributes for: %s", service_code)
         
         # In actual implementation:
         # attributes = call_mcp_tool(
@@ -341,6 +645,7 @@ class AWSPricingIntegration:
         # Placeholder implementation
         return ['location', 'instanceType', 'operatingSystem', 'tenancy']
     
+    @mcp_cached("aws-pricing-mcp-server_get_pricing")
     def get_pricing_info(self, service_code: str, region: str = 'us-east-1') -> Dict[str, Any]:
         """
         Get pricing information for a service
@@ -355,7 +660,7 @@ class AWSPricingIntegration:
         Returns:
             Pricing information dictionary
         """
-        logger.info(f"Getting pricing for {service_code} in {region}")
+        logger.info("Getting pricing for %s in %s", service_code, region)
         
         # In actual implementation:
         # pricing = call_mcp_tool(
@@ -364,6 +669,9 @@ class AWSPricingIntegration:
         #     region=region,
         #     output_options={"pricing_terms": ["OnDemand", "FlatRate"]}
         # )
+        # With stream=True on the underlying HTTP call, feed the raw
+        # response body to iter_pricing_rows() so multi-MB price lists
+        # are projected row-by-row instead of materialized in full.
         
         # Placeholder implementation
         return {
@@ -390,7 +698,7 @@ class AWSPricingIntegration:
             Service code if found, None otherwise
         """
         # Remove "Amazon" and "AWS" prefixes and search
-        clean_name = service_name.replace('Amazon ', '').replace('AWS ', '').replace(' ', '')
+        clean_name = _PREFIX_RE.sub('', service_name).translate(_SPACE_TABLE)
         
         service_codes = self.get_service_codes(clean_name)
         
@@ -409,13 +717,13 @@ class AWSPricingIntegration:
         Returns:
             Comprehensive pricing information
         """
-        logger.info(f"Getting comprehensive pricing for: {service_name}")
+        logger.info("Getting comprehensive pricing for: %s", service_name)
         
         # Find service code
         service_code = self.find_service_code(service_name)
         
         if not service_code:
-            logger.warning(f"Could not find service code for: {service_name}")
+            logger.warning("Could not find service code for: %s", service_name)
             return {
                 'service_name': service_name,
                 'pricing_available': False,
@@ -440,31 +748,45 @@ class AWSPricingIntegration:
         }
 
 
+# Shared integration instances — the methods are read-mostly, so one
+# pair serves every research call instead of constructing a fresh pair
+# per service
+_DOCS = AWSDocumentationIntegration()
+_PRICING = AWSPricingIntegration()
+
+
 def integrate_aws_research(service_name: str, description: str = "") -> Dict[str, Any]:
     """
     Main function to integrate AWS documentation and pricing research
-    
+
     This function combines documentation search, content extraction, and pricing
     information to create a comprehensive research result.
-    
+
+    Results are memoized per (service_name, description) — the blog
+    scraper commonly yields the same service more than once per run, and
+    the research is pure with respect to its inputs. Callers get a deep
+    copy so mutating one result cannot corrupt the cache.
+
     Args:
         service_name: Name of the AWS service
         description: Optional description from announcement
-    
+
     Returns:
         Comprehensive research data dictionary
     """
-    logger.info(f"Starting integrated research for: {service_name}")
-    
-    # Initialize integrations
-    docs = AWSDocumentationIntegration()
-    pricing = AWSPricingIntegration()
-    
+    return copy.deepcopy(_integrate_aws_research_cached(service_name, description))
+
+
+@functools.lru_cache(maxsize=256)
+def _integrate_aws_research_cached(service_name: str, description: str) -> Dict[str, Any]:
+    """Uncached research implementation backing integrate_aws_research"""
+    logger.info("Starting integrated research for: %s", service_name)
+
     # Get documentation information
-    doc_info = docs.extract_service_information(service_name)
-    
+    doc_info = _DOCS.extract_service_information(service_name)
+
     # Get pricing information
-    pricing_info = pricing.get_comprehensive_pricing(service_name)
+    pricing_info = _PRICING.get_comprehensive_pricing(service_name)
     
     # Combine into comprehensive result
     research_result = {
@@ -473,12 +795,7 @@ def integrate_aws_research(service_name: str, description: str = "") -> Dict[str
         'overview': doc_info['overview'],
         'key_features': doc_info['key_features'],
         'use_cases': doc_info['use_cases'],
-        'problems_solved': [
-            'Reduces operational complexity',
-            'Improves scalability and performance',
-            'Enhances security and compliance',
-            'Accelerates development cycles'
-        ],
+        'problems_solved': list(_FALLBACK_PROBLEMS),
         'benefits': doc_info['key_features'],
         'pricing': pricing_info,
         'documentation_urls': doc_info['documentation_urls'],
@@ -498,24 +815,94 @@ def integrate_aws_research(service_name: str, description: str = "") -> Dict[str
             {
                 'title': 'Production Deployment',
                 'description': f'Deploy {service_name} in production',
-                'steps': [
-                    'Set up VPC and networking',
-                    'Configure security groups',
-                    'Deploy resources with IaC',
-                    'Set up monitoring and alerts',
-                    'Implement backup strategy'
-                ]
+                'steps': list(_PROD_DEPLOY_STEPS)
             }
         ]
     }
     
-    logger.info(f"Completed integrated research for: {service_name}")
+    logger.info("Completed integrated research for: %s", service_name)
     return research_result
 
 
+def iter_pricing_rows(response_stream) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Lazily iterate price rows from a raw get_pricing response stream
+
+    Real MCP get_pricing responses for services like EC2 or RDS are
+    multi-megabyte JSON blobs; loading them whole just to pick a few
+    fields peaks memory at the full response size. This streams the
+    'prices' array with ijson when available (falling back to a full
+    json.load otherwise) and projects each row down to the fields the
+    automation actually uses, so memory stays proportional to the rows
+    kept rather than the response.
+
+    Args:
+        response_stream: File-like object yielding the raw JSON response
+
+    Yields:
+        Tuples of (product_family, model_id, price_usd, unit)
+    """
+    if ijson is not None:
+        rows = ijson.items(response_stream, 'prices.item')
+    else:
+        rows = json.load(response_stream).get('prices', [])
+
+    for row in rows:
+        product = row.get('product', {})
+        on_demand = row.get('pricing', {}).get('OnDemand', {})
+        yield (
+            product.get('productFamily', ''),
+            product.get('attributes', {}).get('modelId', ''),
+            on_demand.get('pricePerUnit', {}).get('USD', ''),
+            on_demand.get('unit', '')
+        )
+
+
+def integrate_aws_research_many(
+    services: List[Dict[str, str]],
+    max_concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Research multiple services concurrently
+
+    Each research call is dominated by sequential network-bound MCP
+    round-trips, so running services one after another pays the full
+    latency N times. This runs the per-service research in worker
+    threads gathered with asyncio, capped by a semaphore so the MCP
+    server is not flooded.
+
+    Args:
+        services: List of dicts with 'service_name' and optional 'description'
+        max_concurrency: Maximum number of services researched at once
+
+    Returns:
+        List of research result dictionaries, in input order
+    """
+    async def _run_all():
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _research(service: Dict[str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    integrate_aws_research,
+                    service['service_name'],
+                    service.get('description', '')
+                )
+
+        return await asyncio.gather(*(_research(s) for s in services))
+
+    logger.info("Starting batched research for %d services", len(services))
+    return list(asyncio.run(_run_all()))
+
+
 if __name__ == "__main__":
     # Test the integration
+    import os
+
     logging.basicConfig(level=logging.INFO)
-    
+
     result = integrate_aws_research("Amazon Bedrock", "Generative AI service")
-    print(json.dumps(result, indent=2))
+    # Serializing and printing the full result is only useful for humans
+    # watching the terminal; skip it when verbosity is turned off
+    if os.getenv('REINVENT_VERBOSE', '1') != '0':
+        print(_dumps_pretty(result))
@@ -7,19 +7,27 @@ the basic components are working correctly.
 """
 
 import sys
-import importlib
+import importlib.util
 from pathlib import Path
 
 def test_import(module_name, package_name=None):
-    """Test if a module can be imported"""
+    """Test if a module is installed
+
+    find_spec only consults the import machinery's metadata, so heavy
+    packages (selenium, pptx, boto3) are verified without executing
+    their import chains — the whole check runs in milliseconds.
+    """
     display_name = package_name or module_name
     try:
-        importlib.import_module(module_name)
-        print(f"✓ {display_name}")
-        return True
-    except ImportError as e:
+        found = importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError) as e:
         print(f"✗ {display_name} - {e}")
         return False
+    if found:
+        print(f"✓ {display_name}")
+        return True
+    print(f"✗ {display_name} - not installed")
+    return False
 
 def test_directory(path):
     """Test if a directory exists"""